@@ -1,33 +1,19 @@
 #!/usr/bin/env python3
 """
-Script to convert hex root to vector of bytes for Move
+Script to convert hex root to vector of bytes for Move.
+For batches of values use move_codec.py.
 """
 
 import sys
 
+from move_codec import to_bytes, U8_DECIMAL
+
 def hex_to_vector(hex_string):
     """
     Converts hex string to vector of bytes for Move
     """
-    # Remove 0x prefix if present
-    if hex_string.startswith('0x'):
-        hex_string = hex_string[2:]
-    
-    # Check that string has even length
-    if len(hex_string) % 2 != 0:
-        raise ValueError("Hex string must have even length")
-    
-    # Split into pairs of characters and convert to decimal numbers
-    bytes_list = []
-    for i in range(0, len(hex_string), 2):
-        hex_byte = hex_string[i:i+2]
-        decimal_byte = int(hex_byte, 16)
-        bytes_list.append(str(decimal_byte))
-    
-    # Form vector for Move
-    vector_string = f"vector[{','.join(bytes_list)}]"
-    
-    return vector_string, bytes_list
+    bytes_list = [U8_DECIMAL[b] for b in to_bytes(hex_string)]
+    return f"vector[{','.join(bytes_list)}]", bytes_list
 
 def main():
     if len(sys.argv) != 2:
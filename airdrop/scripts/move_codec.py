@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Batch codec for Move arguments: PTB literals and BCS bytes.
+
+Encodes `vector<u8>`, `vector<vector<u8>>`, `u64` and `address` values given
+as hex strings or bytes. Every API takes a batch of values so that callers
+generating claim PTBs, proof payloads or scripts for many recipients avoid
+per-byte Python loops.
+
+Usage:
+    python3 move_codec.py encode <type> <value>...
+    python3 move_codec.py stream <type> [--format ptb|bcs] < input > output
+    python3 move_codec.py bench [--count N] [--size BYTES]
+    python3 -m doctest move_codec.py
+
+Types: u8vec, u8vecvec, u64, address.
+In stream mode each input line is one value and produces exactly one output
+line; for u8vecvec the line holds the inner vectors separated by commas or
+whitespace (e.g. a merkle proof), and a blank line is the empty proof. Blank
+lines are rejected for the other types.
+"""
+
+import argparse
+import os
+import re
+import struct
+import sys
+import time
+from itertools import islice
+
+U64_MAX = (1 << 64) - 1
+ADDRESS_LENGTH = 32
+
+# Decimal text of every byte value, so literals are built with a table lookup
+# per byte instead of int()/str() calls.
+U8_DECIMAL = tuple(str(i) for i in range(256))
+
+# ULEB128 prefixes for the lengths that show up in practice (32-byte hashes,
+# proofs of a few dozen nodes); longer lengths fall back to _uleb128.
+_ULEB128_CACHE = tuple(bytes([i]) for i in range(128))
+
+_STREAM_CHUNK = 4096
+
+_HEX_RE = re.compile(r'[0-9a-fA-F]*')
+_DECIMAL_RE = re.compile(r'[0-9]+')
+
+
+# --- Input normalization ---
+
+def _strip_0x(hex_string):
+    hex_string = hex_string.strip()
+    if hex_string.startswith(('0x', '0X')):
+        hex_string = hex_string[2:]
+    return hex_string
+
+
+def _buffer_bytes(value):
+    # Only buffer-protocol objects; bytes(5) would silently give five zero bytes
+    if isinstance(value, (int, str)):
+        raise ValueError(f"Expected hex string or bytes, got {value!r}")
+    try:
+        return bytes(memoryview(value))
+    except TypeError:
+        raise ValueError(f"Expected hex string or bytes, got {value!r}") from None
+
+
+def to_bytes(value):
+    """
+    Converts a hex string (with or without 0x) or bytes-like value to bytes
+
+    >>> to_bytes('0xaabb')
+    b'\\xaa\\xbb'
+    >>> to_bytes('aa  bb')
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid hex string 'aa  bb': contains non-hex characters
+    >>> to_bytes(5)
+    Traceback (most recent call last):
+    ...
+    ValueError: Expected hex string or bytes, got 5
+    """
+    if not isinstance(value, str):
+        return _buffer_bytes(value)
+    hex_string = _strip_0x(value)
+    if not _HEX_RE.fullmatch(hex_string):
+        raise ValueError(f"Invalid hex string {value!r}: contains non-hex characters")
+    if len(hex_string) % 2 != 0:
+        raise ValueError(f"Invalid hex string {value!r}: must have even length")
+    return bytes.fromhex(hex_string)
+
+
+def to_address_bytes(value):
+    """
+    Converts an address (hex string or bytes) to its 32-byte form.
+    Short values are left-padded with zeros the way Sui treats 0x2;
+    empty values are rejected so a missing field never becomes 0x0
+
+    >>> to_address_bytes('0x2').hex()
+    '0000000000000000000000000000000000000000000000000000000000000002'
+    >>> to_address_bytes(b'\\x02') == to_address_bytes('0x02')
+    True
+    >>> to_address_bytes('0x')
+    Traceback (most recent call last):
+    ...
+    ValueError: Address is empty: '0x'
+    >>> to_address_bytes(2)
+    Traceback (most recent call last):
+    ...
+    ValueError: Expected hex string or bytes, got 2
+    """
+    if isinstance(value, str):
+        hex_string = _strip_0x(value)
+        if not hex_string:
+            raise ValueError(f"Address is empty: {value!r}")
+        if len(hex_string) > ADDRESS_LENGTH * 2:
+            raise ValueError(f"Address is longer than {ADDRESS_LENGTH} bytes: {value!r}")
+        if not _HEX_RE.fullmatch(hex_string):
+            raise ValueError(f"Invalid address {value!r}: contains non-hex characters")
+        return to_bytes(hex_string.rjust(ADDRESS_LENGTH * 2, '0'))
+    raw = _buffer_bytes(value)
+    if not raw:
+        raise ValueError("Address is empty")
+    if len(raw) > ADDRESS_LENGTH:
+        raise ValueError(f"Address is longer than {ADDRESS_LENGTH} bytes: {len(raw)}")
+    return raw.rjust(ADDRESS_LENGTH, b'\0')
+
+
+def _to_u64(value):
+    if isinstance(value, bool):
+        raise ValueError(f"Expected an integer, got {value!r}")
+    if isinstance(value, int):
+        number = value
+    elif isinstance(value, str):
+        # ASCII digits only: int() would also take '1_000', '+5' and Unicode digits
+        digits = value.strip()
+        if not _DECIMAL_RE.fullmatch(digits):
+            raise ValueError(f"Invalid decimal integer: {value!r}")
+        number = int(digits, 10)
+    else:
+        raise ValueError(f"Expected an integer, got {value!r}")
+    if number < 0 or number > U64_MAX:
+        raise ValueError(f"Value out of u64 range: {number}")
+    return number
+
+
+def _check_u64(values):
+    """
+    Validates ints or decimal strings as u64, never truncating
+
+    >>> _check_u64([0, '18446744073709551615'])
+    [0, 18446744073709551615]
+    >>> _check_u64([1.5])
+    Traceback (most recent call last):
+    ...
+    ValueError: Expected an integer, got 1.5
+    >>> _check_u64([True])
+    Traceback (most recent call last):
+    ...
+    ValueError: Expected an integer, got True
+    >>> _check_u64(['1_000'])
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid decimal integer: '1_000'
+    """
+    return [_to_u64(v) for v in values]
+
+
+# --- PTB literals ---
+
+def u8_vector_literal(raw):
+    """
+    Formats bytes as a Move `vector[...]` literal
+
+    >>> u8_vector_literal(bytes.fromhex('00ff10'))
+    'vector[0,255,16]'
+    """
+    return f"vector[{','.join(map(U8_DECIMAL.__getitem__, raw))}]"
+
+
+def u8_vector_literals(values):
+    """
+    Batch version of u8_vector_literal for hex/bytes inputs
+    """
+    lookup = U8_DECIMAL.__getitem__
+    return [f"vector[{','.join(map(lookup, to_bytes(v)))}]" for v in values]
+
+
+def u8_vector_vector_literals(values):
+    """
+    Formats each list of hex/bytes items as a `vector[vector[...],...]` literal
+
+    >>> u8_vector_vector_literals([['0x0102', '03'], []])
+    ['vector[vector[1,2],vector[3]]', 'vector[]']
+    """
+    return [f"vector[{','.join(u8_vector_literals(items))}]" for items in values]
+
+
+def u64_literals(values):
+    """
+    Formats integers as PTB u64 arguments (plain decimal, as in the scripts)
+    """
+    return [str(v) for v in _check_u64(values)]
+
+
+def address_literals(values):
+    """
+    Formats addresses as PTB `@0x...` literals with the full 32-byte form
+    """
+    return [f"@0x{to_address_bytes(v).hex()}" for v in values]
+
+
+# --- BCS ---
+
+def _uleb128(n):
+    """
+    >>> [_uleb128(n).hex() for n in (0, 127, 128, 300, 16384)]
+    ['00', '7f', '8001', 'ac02', '808001']
+    """
+    if n < 128:
+        return _ULEB128_CACHE[n]
+    out = bytearray()
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def bcs_u8_vector(raw):
+    """
+    BCS-encodes bytes as `vector<u8>`
+    """
+    return _uleb128(len(raw)) + raw
+
+
+def bcs_u8_vectors(values):
+    """
+    Batch BCS encoding of hex/bytes inputs as `vector<u8>`
+
+    >>> [b.hex() for b in bcs_u8_vectors(['0x01020304', ''])]
+    ['0401020304', '00']
+    >>> bcs_u8_vectors([bytes(200)])[0][:3].hex()
+    'c80100'
+    """
+    result = []
+    for v in values:
+        raw = to_bytes(v)
+        result.append(_uleb128(len(raw)) + raw)
+    return result
+
+
+def bcs_u8_vector_vectors(values):
+    """
+    Batch BCS encoding of lists of hex/bytes items as `vector<vector<u8>>`
+
+    >>> [b.hex() for b in bcs_u8_vector_vectors([['0102', '03'], []])]
+    ['020201020103', '00']
+    >>> bcs_u8_vector_vectors([[bytes(130)]])[0][:4].hex()
+    '01820100'
+    """
+    result = []
+    for items in values:
+        raws = [to_bytes(item) for item in items]
+        prefixes = [_uleb128(len(r)) for r in raws]
+        outer = _uleb128(len(raws))
+        buf = bytearray(len(outer) + sum(map(len, prefixes)) + sum(map(len, raws)))
+        buf[:len(outer)] = outer
+        offset = len(outer)
+        for prefix, raw in zip(prefixes, raws):
+            end = offset + len(prefix)
+            buf[offset:end] = prefix
+            offset = end + len(raw)
+            buf[end:offset] = raw
+        result.append(bytes(buf))
+    return result
+
+
+def bcs_u64_packed(values):
+    """
+    Packs integers into one buffer of consecutive little-endian u64s
+    """
+    values = _check_u64(values)
+    buf = bytearray(8 * len(values))
+    struct.pack_into(f"<{len(values)}Q", buf, 0, *values)
+    return bytes(buf)
+
+
+def bcs_u64s(values):
+    """
+    Batch BCS encoding of integers as `u64`
+
+    >>> [b.hex() for b in bcs_u64s([1, 1766538972627, 18446744073709551615])]
+    ['0100000000000000', 'd38ded4d9b010000', 'ffffffffffffffff']
+    """
+    packed = bcs_u64_packed(values)
+    return [packed[i:i + 8] for i in range(0, len(packed), 8)]
+
+
+def bcs_addresses(values):
+    """
+    Batch BCS encoding of addresses (32 raw bytes each, no length prefix)
+
+    >>> [len(b) for b in bcs_addresses(['0x2', '0x' + 'ab' * 32])]
+    [32, 32]
+    """
+    return [to_address_bytes(v) for v in values]
+
+
+# --- Registry used by the CLI ---
+
+ENCODERS = {
+    'u8vec': (u8_vector_literals, bcs_u8_vectors),
+    'u8vecvec': (u8_vector_vector_literals, bcs_u8_vector_vectors),
+    'u64': (u64_literals, bcs_u64s),
+    'address': (address_literals, bcs_addresses),
+}
+
+
+def _parse_line(type_name, line):
+    if type_name == 'u8vecvec':
+        return line.replace(',', ' ').split()
+    return line
+
+
+def encode_batch(type_name, values, fmt='ptb'):
+    """
+    Encodes a batch of values of the given type. Returns literal strings for
+    fmt='ptb' and hex-encoded BCS for fmt='bcs'
+    """
+    literal_encoder, bcs_encoder = ENCODERS[type_name]
+    if fmt == 'ptb':
+        return literal_encoder(values)
+    if fmt == 'bcs':
+        return [b.hex() for b in bcs_encoder(values)]
+    raise ValueError(f"Unknown format: {fmt}")
+
+
+def _stream_values(type_name, infile):
+    for line_number, line in enumerate(infile, 1):
+        line = line.strip()
+        if not line and type_name != 'u8vecvec':
+            raise ValueError(f"line {line_number}: empty {type_name} value")
+        yield line_number, _parse_line(type_name, line)
+
+
+def stream(type_name, fmt, infile, outfile, chunk_size=_STREAM_CHUNK):
+    """
+    Reads one value per line from infile and writes one encoded value per line,
+    processing lines in chunks through the batch encoders
+
+    >>> import io
+    >>> stream('u8vecvec', 'ptb', io.StringIO('0xaa 0xbb\\n\\n0xcc\\n'), sys.stdout)
+    vector[vector[170],vector[187]]
+    vector[]
+    vector[vector[204]]
+    >>> stream('u64', 'ptb', io.StringIO('1\\n\\n2\\n'), sys.stdout)
+    Traceback (most recent call last):
+    ...
+    ValueError: line 2: empty u64 value
+    """
+    values = _stream_values(type_name, infile)
+    while True:
+        chunk = list(islice(values, chunk_size))
+        if not chunk:
+            break
+        try:
+            encoded = encode_batch(type_name, [value for _, value in chunk], fmt)
+        except ValueError:
+            # Re-encode one by one to report the offending line
+            for line_number, value in chunk:
+                try:
+                    encode_batch(type_name, [value], fmt)
+                except ValueError as e:
+                    raise ValueError(f"line {line_number}: {e}") from None
+            raise
+        outfile.write('\n'.join(encoded))
+        outfile.write('\n')
+
+
+# --- Benchmark ---
+
+def _naive_literal(hex_string):
+    # The per-byte loop previously used by convert_root_to_vector.py
+    hex_string = _strip_0x(hex_string)
+    bytes_list = []
+    for i in range(0, len(hex_string), 2):
+        bytes_list.append(str(int(hex_string[i:i + 2], 16)))
+    return f"vector[{','.join(bytes_list)}]"
+
+
+def _measure(label, fn, count, total_bytes):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f}s  {count / elapsed:12,.0f} values/s  "
+          f"{total_bytes / elapsed / 1e6:8.1f} MB/s")
+
+
+def bench(count, size):
+    """
+    Prints throughput of the batch encoders against the per-byte loop
+    """
+    values = [os.urandom(size).hex() for _ in range(count)]
+    addresses = [os.urandom(ADDRESS_LENGTH).hex() for _ in range(count)]
+    proofs = [values[i:i + 16] for i in range(0, count, 16)]
+    numbers = list(range(count))
+    total = count * size
+
+    print(f"{count} values of {size} bytes")
+    _measure("naive per-byte literal", lambda: [_naive_literal(v) for v in values], count, total)
+    _measure("u8vec literal", lambda: u8_vector_literals(values), count, total)
+    _measure("u8vec bcs", lambda: bcs_u8_vectors(values), count, total)
+    _measure("u8vecvec literal (16/proof)", lambda: u8_vector_vector_literals(proofs), count, total)
+    _measure("u8vecvec bcs (16/proof)", lambda: bcs_u8_vector_vectors(proofs), count, total)
+    _measure("u64 literal", lambda: u64_literals(numbers), count, count * 8)
+    _measure("u64 bcs", lambda: bcs_u64s(numbers), count, count * 8)
+    _measure("address literal", lambda: address_literals(addresses), count, count * ADDRESS_LENGTH)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Encode Move arguments as PTB literals or BCS.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    encode_parser = subparsers.add_parser("encode", help="Encode values given on the command line")
+    encode_parser.add_argument("type", choices=ENCODERS)
+    encode_parser.add_argument("values", nargs="+")
+    encode_parser.add_argument("--format", choices=("ptb", "bcs"), default="ptb")
+
+    stream_parser = subparsers.add_parser("stream", help="Encode one value per line from stdin to stdout")
+    stream_parser.add_argument("type", choices=ENCODERS)
+    stream_parser.add_argument("--format", choices=("ptb", "bcs"), default="ptb")
+
+    bench_parser = subparsers.add_parser("bench", help="Measure encoder throughput")
+    bench_parser.add_argument("--count", type=int, default=100_000)
+    bench_parser.add_argument("--size", type=int, default=32)
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "encode":
+            values = [_parse_line(args.type, v) for v in args.values]
+            print('\n'.join(encode_batch(args.type, values, args.format)))
+        elif args.command == "stream":
+            stream(args.type, args.format, sys.stdin, sys.stdout)
+        else:
+            bench(args.count, args.size)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()